@@ -6,12 +6,22 @@ Versión: 2.0
 Autor: Sistema de Organización Digital
 """
 
+import errno
 import os
 import shutil
+import stat
 import json
+import logging
+import queue
+import re
 import sys
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
@@ -21,28 +31,103 @@ import webbrowser
 from typing import Dict, List, Optional, Tuple
 import traceback
 
+# Sufijos " (n)" (posiblemente encadenados) que genera
+# generar_nombre_unico al resolver colisiones; se usan para agrupar por
+# clase de equivalencia de nombres en organizar_carpeta
+_SUFIJO_COPIA = re.compile(r'(?: \(\d+\))+$')
+
+# platform.system()/release() hacen trabajo no trivial en la primera
+# llamada; se resuelven una vez al importar y el resto del módulo lee
+# las constantes
+_OS_NOMBRE = platform.system()
+_OS_VERSION = platform.release()
+
+# JSON acelerado si orjson está disponible (2-10x más rápido según crece
+# el historial); si no, la stdlib con el mismo contrato en bytes
+try:
+    import orjson
+
+    def _json_dumps(objeto) -> bytes:
+        return orjson.dumps(objeto, option=orjson.OPT_INDENT_2)
+
+    def _json_dumps_compacto(objeto) -> bytes:
+        return orjson.dumps(objeto)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(objeto) -> bytes:
+        return json.dumps(objeto, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _json_dumps_compacto(objeto) -> bytes:
+        return json.dumps(objeto, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+    _json_loads = json.loads
+
 # ============================================================================
 # CONFIGURACIÓN Y CONSTANTES
 # ============================================================================
 
 class Configuracion:
     """Maneja la configuración del organizador"""
-    
+
+    # Entradas de historial que se conservan en config.json para mostrar;
+    # el historial completo vive en historial.ndjson
+    HISTORIAL_MAX = 50
+
+    # Ruta resuelta (y directorio creado) una sola vez por proceso; las
+    # llamadas posteriores no repiten expanduser/makedirs
+    _ruta_config_cache = None
+
     @staticmethod
     def obtener_ruta_config():
         """Obtiene la ruta del archivo de configuración según el sistema operativo"""
-        sistema = platform.system()
-        
-        if sistema == "Windows":
+        if Configuracion._ruta_config_cache is not None:
+            return Configuracion._ruta_config_cache
+
+        if _OS_NOMBRE == "Windows":
             config_dir = os.path.join(os.getenv('APPDATA'), 'OrganizadorAutomatico')
-        elif sistema == "Darwin":  # macOS
+        elif _OS_NOMBRE == "Darwin":  # macOS
             config_dir = os.path.expanduser("~/Library/Application Support/OrganizadorAutomatico")
         else:  # Linux y otros
             config_dir = os.path.expanduser("~/.config/organizadorautomatico")
         
         os.makedirs(config_dir, exist_ok=True)
-        return os.path.join(config_dir, 'config.json')
-    
+        Configuracion._ruta_config_cache = os.path.join(config_dir, 'config.json')
+        return Configuracion._ruta_config_cache
+
+    @staticmethod
+    def obtener_ruta_historial():
+        """Obtiene la ruta del historial append-only (NDJSON)"""
+        return os.path.join(
+            os.path.dirname(Configuracion.obtener_ruta_config()),
+            'historial.ndjson'
+        )
+
+    @staticmethod
+    def agregar_historial(entrada):
+        """Añade una entrada al historial en disco (append O(1), sin
+        reescribir el archivo completo como hacía config.json)"""
+        try:
+            with open(Configuracion.obtener_ruta_historial(), 'ab') as f:
+                f.write(_json_dumps_compacto(entrada) + b"\n")
+        except Exception as e:
+            print(f"Error guardando historial: {e}")
+
+    @staticmethod
+    def leer_historial():
+        """Itera el historial en streaming, una entrada por línea"""
+        ruta = Configuracion.obtener_ruta_historial()
+        if not os.path.exists(ruta):
+            return
+        with open(ruta, 'rb') as f:
+            for linea in f:
+                linea = linea.strip()
+                if linea:
+                    try:
+                        yield _json_loads(linea)
+                    except ValueError:
+                        continue
+
     @staticmethod
     def cargar():
         """Carga la configuración desde archivo o crea una por defecto"""
@@ -101,31 +186,35 @@ class Configuracion:
         
         try:
             if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                
+                with open(config_file, 'rb') as f:
+                    config = _json_loads(f.read())
+
                 # Actualizar si hay nuevas configuraciones
                 for key, value in config_default.items():
                     if key not in config:
                         config[key] = value
-                
-                return config
             else:
-                return config_default
-                
+                config = config_default
+
         except Exception as e:
             print(f"Error cargando configuración: {e}")
-            return config_default
+            config = config_default
+
+        return config
     
     @staticmethod
     def guardar(config):
-        """Guarda la configuración en archivo"""
+        """Guarda la configuración en archivo (escritura atómica)"""
         try:
             config_file = Configuracion.obtener_ruta_config()
             config["ultima_actualizacion"] = datetime.now().isoformat()
-            
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+
+            # Escribir a un temporal y renombrar: una sola escritura por
+            # operación y sin riesgo de config corrupta si se interrumpe
+            tmp_file = config_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(config))
+            os.replace(tmp_file, config_file)
             return True
         except Exception as e:
             print(f"Error guardando configuración: {e}")
@@ -135,11 +224,143 @@ class Configuracion:
 # NÚCLEO DEL ORGANIZADOR
 # ============================================================================
 
+# Hash de contenido para detectar duplicados reales: xxhash si está
+# instalado (satura el ancho de banda de memoria), blake2b de la stdlib
+# si no
+try:
+    import xxhash
+    _nuevo_hasher = xxhash.xxh3_128
+except ImportError:
+    import hashlib
+
+    def _nuevo_hasher():
+        return hashlib.blake2b(digest_size=16)
+
+
+def _hash_archivo(ruta: str) -> bytes:
+    """Calcula el hash del contenido de un archivo por bloques"""
+    hasher = _nuevo_hasher()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(bloque)
+    return hasher.digest()
+
+
+_log_listener = None
+
+
+def _crear_logger() -> logging.Logger:
+    """Logger con cola: los hilos trabajadores solo encolan el registro
+    y un listener en segundo plano hace la E/S, sin bloquear el pool"""
+    global _log_listener
+    logger = logging.getLogger("organizador")
+    if not logger.handlers:
+        cola = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(cola))
+        logger.setLevel(logging.INFO)
+
+        ruta_log = os.path.join(
+            os.path.dirname(Configuracion.obtener_ruta_config()),
+            "organizador.log"
+        )
+        try:
+            destino = logging.FileHandler(ruta_log, encoding='utf-8')
+        except OSError:
+            destino = logging.StreamHandler()
+        destino.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+        )
+        _log_listener = QueueListener(cola, destino)
+        _log_listener.start()
+    return logger
+
+
+@dataclass(slots=True, frozen=True)
+class ConfigEjecucion:
+    """Instantánea inmutable de la configuración para una ejecución
+
+    Leer un atributo de una clase con slots es una sola carga a nivel C,
+    frente a las dos búsquedas de dict anidadas que costaba cada
+    self.config["configuracion"]["..."] en el camino caliente.
+    """
+    organizar_por_tipo: bool
+    organizar_por_fecha: bool
+    formato_fecha: str
+    organizar_por_proyecto: bool
+    mover_archivos: bool
+    modo_seguro: bool
+    mantener_estructura_original: bool
+    ignorar_ocultos: bool
+    ignorar_sistemas: bool
+
+    @classmethod
+    def desde_config(cls, config: Dict) -> "ConfigEjecucion":
+        opciones = config["configuracion"]
+        return cls(
+            organizar_por_tipo=opciones["organizar_por_tipo"],
+            organizar_por_fecha=opciones["organizar_por_fecha"],
+            formato_fecha=opciones["formato_fecha"],
+            organizar_por_proyecto=opciones["organizar_por_proyecto"],
+            mover_archivos=opciones["mover_archivos"],
+            modo_seguro=opciones["modo_seguro"],
+            mantener_estructura_original=opciones["mantener_estructura_original"],
+            ignorar_ocultos=opciones["ignorar_ocultos"],
+            ignorar_sistemas=opciones["ignorar_sistemas"],
+        )
+
+
+# Archivos que delatan la raíz de un proyecto
+_INDICADORES_PROYECTO = frozenset([
+    "package.json", "requirements.txt", "pom.xml", "build.gradle",
+    "Cargo.toml", "composer.json", ".git", ".gitignore", ".svn",
+    "README.md", "Makefile", "CMakeLists.txt", "Dockerfile",
+    "docker-compose.yml", "pyproject.toml", "setup.py",
+    "index.html", "manifest.json", "pubspec.yaml"
+])
+
+
+@lru_cache(maxsize=4096)
+def _proyecto_de_directorio(directorio: str) -> Optional[str]:
+    """Devuelve el nombre del proyecto si el directorio contiene un indicador
+
+    Un solo readdir por directorio en lugar de un exists() por indicador;
+    el lru_cache amortiza el coste entre todos los archivos que comparten
+    la misma carpeta padre.
+    """
+    try:
+        with os.scandir(directorio) as iterador:
+            for entrada in iterador:
+                if entrada.name in _INDICADORES_PROYECTO:
+                    return os.path.basename(directorio) or directorio
+    except OSError:
+        pass
+    return None
+
+
 class OrganizadorAutomatico:
     """Clase principal que maneja la organización de archivos"""
-    
+
+    # Archivos y extensiones que nunca se organizan
+    ARCHIVOS_SISTEMA = frozenset([
+        "desktop.ini", ".DS_Store", "Thumbs.db",
+        ".localized", ".Spotlight-V100", ".fseventsd"
+    ])
+    EXTENSIONES_TEMP = frozenset([".tmp", ".temp", ".crdownload", ".part", ".download"])
+
+    # Formatos de fecha admitidos en la config → patrón strftime
+    # Formateadores sobre struct_time: time.localtime es una llamada C
+    # directa y un f-string sobre sus campos evita construir (y formatear
+    # con strftime) un datetime por archivo
+    FORMATOS_FECHA = {
+        "YYYY/MM": lambda lt: f"{lt.tm_year}/{lt.tm_mon:02d}",
+        "AAAA/MM/DD": lambda lt: f"{lt.tm_year}-{lt.tm_mon:02d}-{lt.tm_mday:02d}",
+        "YYYY-MM": lambda lt: f"{lt.tm_year}-{lt.tm_mon:02d}",
+    }
+
     def __init__(self, config=None):
         self.config = config or Configuracion.cargar()
+        self.logger = _crear_logger()
+        self._reconstruir_indices()
         self.estadisticas = {
             "archivos_procesados": 0,
             "archivos_movidos": 0,
@@ -149,189 +370,353 @@ class OrganizadorAutomatico:
             "espacio_liberado": 0
         }
         self.archivos_conflictivos = []
-        self.en_ejecucion = False
-        
+        # Eventos atómicos a nivel C: lecturas seguras y baratas desde
+        # los hilos trabajadores
+        self._ejecutando = threading.Event()
+        self._cancelado = threading.Event()
+        self._lock_estadisticas = threading.Lock()
+        self._cache_fechas = {}
+        self._dirs_aseguradas = set()
+
+    @property
+    def en_ejecucion(self) -> bool:
+        """Indica si hay una organización en curso"""
+        return self._ejecutando.is_set()
+
+    def _reconstruir_indices(self):
+        """Precalcula índices derivados de la config (llamar tras cambiarla)
+
+        Los índices viven solo en el organizador: la config se queda
+        como datos planos serializables con json.dumps por cualquiera
+        """
+        conjuntos = {
+            categoria: frozenset(ext.lower() for ext in exts)
+            for categoria, exts in self.config["extensiones"].items()
+        }
+        self._ext_a_categoria = {
+            ext: categoria
+            for categoria, extensiones in conjuntos.items()
+            for ext in extensiones
+        }
+        self._formatear_fecha = self.FORMATOS_FECHA.get(
+            self.config["configuracion"]["formato_fecha"],
+            self.FORMATOS_FECHA["YYYY-MM"],
+        )
+        self._max_bytes = int(self.config["configuracion"]["tamaño_maximo_mb"]) * 1024 * 1024
+        self._rc = ConfigEjecucion.desde_config(self.config)
+
     def obtener_categoria(self, extension: str) -> str:
         """Determina la categoría basada en la extensión del archivo"""
-        extension = extension.lower()
-        
-        for categoria, extensiones in self.config["extensiones"].items():
-            if extension in extensiones:
-                return categoria
-        
-        return "Otros"
+        return self._ext_a_categoria.get(extension.lower(), "Otros")
+
+    @staticmethod
+    def _recorrer_archivos(raiz):
+        """Recorre una carpeta recursivamente con os.scandir generando DirEntry
+
+        A diferencia de rglob('*') + is_file(), cada entrada sale del
+        readdir ya clasificada y con el stat cacheado, sin crear objetos
+        Path intermedios.
+        """
+        pendientes = [os.fspath(raiz)]
+        while pendientes:
+            directorio = pendientes.pop()
+            try:
+                with os.scandir(directorio) as iterador:
+                    for entrada in iterador:
+                        if entrada.is_dir(follow_symlinks=False):
+                            pendientes.append(entrada.path)
+                        elif entrada.is_file(follow_symlinks=False):
+                            yield entrada
+            except PermissionError:
+                continue
     
     def generar_nombre_unico(self, ruta_destino: Path) -> Path:
         """Genera un nombre único si el archivo ya existe"""
         if not ruta_destino.exists():
             return ruta_destino
-        
-        contador = 1
+
         nombre_base = ruta_destino.stem
         extension = ruta_destino.suffix
         directorio = ruta_destino.parent
-        
-        while True:
-            nuevo_nombre = directorio / f"{nombre_base} ({contador}){extension}"
-            if not nuevo_nombre.exists():
-                return nuevo_nombre
-            contador += 1
+
+        def existe(indice: int) -> bool:
+            return (directorio / f"{nombre_base} ({indice}){extension}").exists()
+
+        # Búsqueda exponencial + binaria: O(log n) comprobaciones de
+        # existencia aunque el mismo nombre colisione miles de veces
+        inferior, superior = 1, 1
+        while existe(superior):
+            inferior = superior + 1
+            superior *= 2
+
+        while inferior < superior:
+            medio = (inferior + superior) // 2
+            if existe(medio):
+                inferior = medio + 1
+            else:
+                superior = medio
+
+        return directorio / f"{nombre_base} ({inferior}){extension}"
     
-    def crear_estructura_carpetas(self, ruta_base: Path, categorias: List[str]) -> Path:
-        """Crea la estructura de carpetas según las reglas"""
+    def _componer_ruta_destino(self, ruta_base: Path, categorias: List[str]) -> Path:
+        """Compone la carpeta de destino según las reglas, sin tocar el disco"""
+        rc = self._rc
         ruta_actual = ruta_base
-        
+
         # 1. Por categoría
-        if self.config["configuracion"]["organizar_por_tipo"]:
+        if rc.organizar_por_tipo:
             ruta_actual = ruta_actual / categorias[0]
-        
+
         # 2. Por fecha
-        if self.config["configuracion"]["organizar_por_fecha"] and len(categorias) > 1:
-            formato = self.config["configuracion"]["formato_fecha"]
+        if rc.organizar_por_fecha and len(categorias) > 1:
             fecha_str = categorias[1]
-            
-            if formato == "YYYY/MM":
+
+            if rc.formato_fecha == "YYYY/MM":
                 ruta_actual = ruta_actual / fecha_str[:4] / fecha_str[5:7]
-            elif formato == "AAAA/MM/DD":
+            elif rc.formato_fecha == "AAAA/MM/DD":
                 partes = fecha_str.split('-')
                 ruta_actual = ruta_actual / partes[0] / partes[1] / partes[2]
             else:  # YYYY-MM
                 ruta_actual = ruta_actual / fecha_str
-        
+
         # 3. Por proyecto (si está activado y hay información)
-        if (self.config["configuracion"]["organizar_por_proyecto"] and 
+        if (rc.organizar_por_proyecto and
             len(categorias) > 2 and categorias[2]):
             ruta_actual = ruta_actual / categorias[2]
-        
-        # Crear la carpeta si no existe
-        ruta_actual.mkdir(parents=True, exist_ok=True)
-        self.estadisticas["carpetas_creadas"] += 1
-        
+
+        return ruta_actual
+
+    def _asegurar_carpeta(self, ruta: Path):
+        """Crea la carpeta si no existe, cacheando las ya aseguradas en
+        esta ejecución para no repetir mkdir/stat por cada archivo"""
+        clave = os.fspath(ruta)
+        if clave not in self._dirs_aseguradas:
+            with self._lock_estadisticas:
+                if clave not in self._dirs_aseguradas:
+                    existia = ruta.is_dir()
+                    ruta.mkdir(parents=True, exist_ok=True)
+                    if not existia:
+                        self.estadisticas["carpetas_creadas"] += 1
+
+                    # mkdir(parents=True) ya aseguró también los ancestros
+                    while clave not in self._dirs_aseguradas:
+                        self._dirs_aseguradas.add(clave)
+                        padre = os.path.dirname(clave)
+                        if padre == clave:
+                            break
+                        clave = padre
+
+    def crear_estructura_carpetas(self, ruta_base: Path, categorias: List[str]) -> Path:
+        """Crea la estructura de carpetas según las reglas"""
+        ruta_actual = self._componer_ruta_destino(ruta_base, categorias)
+        self._asegurar_carpeta(ruta_actual)
         return ruta_actual
+
+    def _carpeta_destino_de(self, entrada, carpeta_destino: Path) -> Optional[Path]:
+        """Calcula la carpeta final de un archivo sin tocar el disco
+
+        Devuelve None si el archivo va a ser ignorado u omitido; es la
+        pasada de clasificación previa a crear carpetas y mover.
+        """
+        nombre = entrada.name
+        extension = os.path.splitext(nombre)[1].lower()
+        if self.debe_ignorar(nombre, extension):
+            return None
+
+        try:
+            stat_info = entrada.stat()
+        except OSError:
+            return None
+        if stat_info.st_size > self._max_bytes:
+            return None
+
+        rc = self._rc
+        categorias = [self._ext_a_categoria.get(extension, "Otros")]
+        if rc.organizar_por_fecha:
+            categorias.append(self._fecha_formateada(stat_info.st_mtime))
+        if rc.organizar_por_proyecto:
+            proyecto = self.detectar_proyecto(Path(os.fspath(entrada)))
+            categorias.append(proyecto or "Sin Proyecto")
+
+        return self._componer_ruta_destino(carpeta_destino, categorias)
     
-    def procesar_archivo(self, archivo_path: Path, carpeta_destino: Path = None) -> Tuple[bool, str]:
-        """Procesa un archivo individual"""
+    def procesar_archivo(self, archivo, carpeta_destino: Path = None,
+                         carpeta_final: Path = None) -> Tuple[bool, str]:
+        """Procesa un archivo individual (acepta os.DirEntry o Path)
+
+        Si organizar_carpeta ya clasificó el archivo, recibe su carpeta
+        final precalculada y la fase de movimiento no repite ninguna
+        clasificación.
+        """
+        # Extraer nombre/extensión una sola vez; cada acceso a pathlib
+        # vuelve a parsear la ruta completa
+        ruta = os.fspath(archivo)
+        nombre = archivo.name
+        extension = os.path.splitext(nombre)[1].lower()
+        rc = self._rc
         try:
-            # Verificar si el archivo debe ser ignorado
-            if self.debe_ignorar(archivo_path):
-                self.estadisticas["archivos_omitidos"] += 1
-                return False, "ignorado"
-            
-            # Obtener información del archivo
-            stat_info = archivo_path.stat()
-            fecha_modificacion = datetime.fromtimestamp(stat_info.st_mtime)
-            tamaño = stat_info.st_size
-            
-            # Verificar tamaño máximo
-            tamaño_mb = tamaño / (1024 * 1024)
-            if tamaño_mb > self.config["configuracion"]["tamaño_maximo_mb"]:
-                self.estadisticas["archivos_omitidos"] += 1
-                return False, "tamaño_excedido"
-            
-            # Determinar categoría
-            categoria = self.obtener_categoria(archivo_path.suffix)
-            
-            # Preparar categorías para estructura
-            categorias = [categoria]
-            
-            # Agregar fecha según formato
-            if self.config["configuracion"]["organizar_por_fecha"]:
-                formato = self.config["configuracion"]["formato_fecha"]
-                if formato == "YYYY/MM":
-                    fecha_str = fecha_modificacion.strftime("%Y/%m")
-                elif formato == "AAAA/MM/DD":
-                    fecha_str = fecha_modificacion.strftime("%Y-%m-%d")
-                else:  # YYYY-MM
-                    fecha_str = fecha_modificacion.strftime("%Y-%m")
-                categorias.append(fecha_str)
-            
-            # Agregar proyecto si está activado
-            if self.config["configuracion"]["organizar_por_proyecto"]:
-                proyecto = self.detectar_proyecto(archivo_path)
-                categorias.append(proyecto or "Sin Proyecto")
-            
-            # Determinar carpeta de destino
-            if carpeta_destino is None:
-                if self.config["configuracion"]["mantener_estructura_original"]:
-                    carpeta_destino = archivo_path.parent / "Organizados"
-                else:
-                    carpeta_destino = archivo_path.parent
-            
-            # Crear estructura y obtener ruta final
-            carpeta_final = self.crear_estructura_carpetas(carpeta_destino, categorias)
-            ruta_destino = carpeta_final / archivo_path.name
-            
-            # Verificar si ya existe y generar nombre único si es necesario
+            # Abortar cuanto antes si se canceló la operación
+            if self._cancelado.is_set():
+                return False, "cancelado"
+
+            if carpeta_final is None:
+                # Sin plan precalculado: clasificar aquí mismo
+
+                # Verificar si el archivo debe ser ignorado (antes de
+                # gastar ningún stat en él)
+                if self.debe_ignorar(nombre, extension):
+                    with self._lock_estadisticas:
+                        self.estadisticas["archivos_omitidos"] += 1
+                    return False, "ignorado"
+
+                # Obtener información del archivo (DirEntry.stat()
+                # reutiliza el resultado cacheado del readdir)
+                stat_info = archivo.stat()
+                tamaño = stat_info.st_size
+
+                # Verificar tamaño máximo (umbral precalculado en bytes:
+                # comparación entera, sin división por archivo)
+                if tamaño > self._max_bytes:
+                    with self._lock_estadisticas:
+                        self.estadisticas["archivos_omitidos"] += 1
+                    return False, "tamaño_excedido"
+
+                # Determinar categoría y estructura
+                categorias = [self._ext_a_categoria.get(extension, "Otros")]
+
+                # Agregar fecha según formato
+                if rc.organizar_por_fecha:
+                    categorias.append(self._fecha_formateada(stat_info.st_mtime))
+
+                # Agregar proyecto si está activado
+                if rc.organizar_por_proyecto:
+                    proyecto = self.detectar_proyecto(Path(ruta))
+                    categorias.append(proyecto or "Sin Proyecto")
+
+                # Determinar carpeta de destino
+                if carpeta_destino is None:
+                    padre = Path(os.path.dirname(ruta))
+                    if rc.mantener_estructura_original:
+                        carpeta_destino = padre / "Organizados"
+                    else:
+                        carpeta_destino = padre
+
+                # Crear estructura y obtener ruta final
+                carpeta_final = self.crear_estructura_carpetas(carpeta_destino, categorias)
+            else:
+                stat_info = archivo.stat()
+                tamaño = stat_info.st_size
+
+            ruta_destino = carpeta_final / nombre
+
+            # Verificar si ya existe: primero comparar tamaños (barato) y
+            # solo entonces hashear; un duplicado real no genera copia " (1)"
             if ruta_destino.exists():
-                if self.config["configuracion"]["modo_seguro"]:
-                    self.archivos_conflictivos.append(str(archivo_path))
+                # El archivo ya está en su sitio (p.ej. reorganizar una
+                # carpeta ya organizada): no compararlo consigo mismo
+                if os.path.samefile(ruta, ruta_destino):
+                    with self._lock_estadisticas:
+                        self.estadisticas["archivos_omitidos"] += 1
+                    return False, "sin_cambios"
+
+                try:
+                    if (ruta_destino.stat().st_size == tamaño
+                            and _hash_archivo(ruta) == _hash_archivo(os.fspath(ruta_destino))):
+                        # Mismo contenido: eliminar el origen al mover
+                        # (nunca en modo seguro) y omitir el archivo
+                        if rc.mover_archivos and not rc.modo_seguro:
+                            os.unlink(ruta)
+                        with self._lock_estadisticas:
+                            self.estadisticas["archivos_omitidos"] += 1
+                        return False, "duplicado"
+                except OSError:
+                    pass
+
+                if rc.modo_seguro:
+                    self.archivos_conflictivos.append(ruta)
                     return False, "conflicto"
                 else:
                     ruta_destino = self.generar_nombre_unico(ruta_destino)
-            
+
             # Mover o copiar el archivo
-            if self.config["configuracion"]["mover_archivos"]:
-                shutil.move(str(archivo_path), str(ruta_destino))
+            if rc.mover_archivos:
+                destino_final = os.fspath(ruta_destino)
+                try:
+                    # Mismo sistema de archivos: un único rename atómico,
+                    # sin los stat extra ni el fallback Python de shutil.move
+                    os.replace(ruta, destino_final)
+                except OSError as e:
+                    if e.errno == errno.EXDEV:
+                        shutil.move(ruta, destino_final)
+                    else:
+                        raise
                 accion = "movido"
             else:
-                shutil.copy2(str(archivo_path), str(ruta_destino))
+                shutil.copy2(ruta, os.fspath(ruta_destino))
                 accion = "copiado"
             
             # Actualizar estadísticas
-            self.estadisticas["archivos_procesados"] += 1
-            self.estadisticas["archivos_movidos"] += 1
-            self.estadisticas["espacio_liberado"] += tamaño
-            
+            with self._lock_estadisticas:
+                self.estadisticas["archivos_procesados"] += 1
+                self.estadisticas["archivos_movidos"] += 1
+                self.estadisticas["espacio_liberado"] += tamaño
+
             return True, accion
-            
+
         except PermissionError:
-            self.estadisticas["errores"] += 1
+            with self._lock_estadisticas:
+                self.estadisticas["errores"] += 1
             return False, "permiso_denegado"
-        except Exception as e:
-            self.estadisticas["errores"] += 1
-            print(f"Error procesando {archivo_path}: {e}")
-            traceback.print_exc()
+        except Exception:
+            with self._lock_estadisticas:
+                self.estadisticas["errores"] += 1
+            self.logger.exception(f"Error procesando {ruta}")
             return False, "error"
     
-    def debe_ignorar(self, archivo_path: Path) -> bool:
-        """Determina si un archivo debe ser ignorado"""
-        nombre = archivo_path.name
-        
+    def _fecha_formateada(self, mtime: float) -> str:
+        """Formatea la fecha de modificación cacheando por día local
+
+        El formateador se resuelve una sola vez en _reconstruir_indices;
+        todos los archivos modificados el mismo día local reutilizan la
+        cadena cacheada. La clave sale del propio time.localtime (año y
+        día del año): un cubo de época UTC cruzaría dos fechas locales y
+        archivaría archivos en la carpeta del día equivocado.
+        """
+        lt = time.localtime(mtime)
+        clave = (lt.tm_year, lt.tm_yday)
+        fecha_str = self._cache_fechas.get(clave)
+        if fecha_str is None:
+            fecha_str = self._formatear_fecha(lt)
+            self._cache_fechas[clave] = fecha_str
+        return fecha_str
+
+    def debe_ignorar(self, nombre: str, extension: str) -> bool:
+        """Determina si un archivo debe ser ignorado (extensión en minúsculas)"""
+        rc = self._rc
+
         # Ignorar archivos ocultos
-        if self.config["configuracion"]["ignorar_ocultos"] and nombre.startswith('.'):
+        if rc.ignorar_ocultos and nombre.startswith('.'):
             return True
-        
+
         # Ignorar archivos de sistema
-        if self.config["configuracion"]["ignorar_sistemas"]:
-            archivos_sistema = ["desktop.ini", ".DS_Store", "Thumbs.db", 
-                               ".localized", ".Spotlight-V100", ".fseventsd"]
-            if nombre in archivos_sistema:
-                return True
-        
+        if rc.ignorar_sistemas and nombre in self.ARCHIVOS_SISTEMA:
+            return True
+
         # Ignorar extensiones temporales
-        extensiones_temp = [".tmp", ".temp", ".crdownload", ".part", ".download"]
-        if archivo_path.suffix.lower() in extensiones_temp:
+        if extension in self.EXTENSIONES_TEMP:
             return True
-        
+
         return False
     
     def detectar_proyecto(self, archivo_path: Path) -> Optional[str]:
         """Intenta detectar el proyecto basado en archivos comunes"""
-        # Archivos que indican un proyecto
-        indicadores = [
-            "package.json", "requirements.txt", "pom.xml", "build.gradle",
-            "Cargo.toml", "composer.json", ".git", ".gitignore", ".svn",
-            "README.md", "Makefile", "CMakeLists.txt", "Dockerfile",
-            "docker-compose.yml", "pyproject.toml", "setup.py",
-            "index.html", "manifest.json", "pubspec.yaml"
-        ]
-        
-        # Buscar en el directorio actual y padres
+        # Buscar en el directorio actual y padres (escaneo cacheado
+        # por directorio)
         for directorio in [archivo_path.parent] + list(archivo_path.parents):
-            for indicador in indicadores:
-                if (directorio / indicador).exists():
-                    return directorio.name
-        
+            proyecto = _proyecto_de_directorio(os.fspath(directorio))
+            if proyecto:
+                return proyecto
+
         # Buscar por palabras clave en el nombre del archivo
         palabras_clave = ["proyecto", "project", "trabajo", "work", "cliente", "client"]
         nombre_archivo = archivo_path.stem.lower()
@@ -344,10 +729,11 @@ class OrganizadorAutomatico:
     
     def organizar_carpeta(self, carpeta_path: str, callback_progreso=None) -> Dict:
         """Organiza todos los archivos en una carpeta"""
-        if self.en_ejecucion:
+        if self._ejecutando.is_set():
             return {"error": "Ya hay una operación en curso"}
-        
-        self.en_ejecucion = True
+
+        self._ejecutando.set()
+        self._cancelado.clear()
         self.estadisticas = {
             "archivos_procesados": 0,
             "archivos_movidos": 0,
@@ -357,31 +743,90 @@ class OrganizadorAutomatico:
             "espacio_liberado": 0
         }
         self.archivos_conflictivos = []
-        
+        self._cache_fechas.clear()
+        self._dirs_aseguradas.clear()
+        # La interfaz puede haber tocado la config desde la última vez
+        self._reconstruir_indices()
+
         try:
             carpeta = Path(carpeta_path)
-            if not carpeta.exists() or not carpeta.is_dir():
+            # Un solo stat en lugar de exists() + is_dir()
+            try:
+                if not stat.S_ISDIR(os.stat(carpeta).st_mode):
+                    return {"error": "Carpeta no válida"}
+            except OSError:
                 return {"error": "Carpeta no válida"}
             
             # Recopilar todos los archivos
-            archivos = []
-            for item in carpeta.rglob('*'):
-                if item.is_file():
-                    archivos.append(item)
-            
+            archivos = list(self._recorrer_archivos(carpeta))
+
             total_archivos = len(archivos)
-            
-            # Procesar archivos
-            for i, archivo in enumerate(archivos):
-                if not self.en_ejecucion:
-                    break
-                    
-                exito, mensaje = self.procesar_archivo(archivo, carpeta / "Organizados")
-                
-                # Llamar al callback de progreso si existe
-                if callback_progreso:
-                    progreso = (i + 1) / total_archivos * 100
-                    callback_progreso(progreso, f"Procesando: {archivo.name}")
+            destino = carpeta / "Organizados"
+
+            # Primera pasada: plan de movimientos (entrada → carpeta
+            # final, None si se va a ignorar u omitir) sin tocar el disco.
+            # Cada carpeta única se crea exactamente una vez y los hilos
+            # de movimiento no compiten con mkdir ni reclasifican nada
+            destino_de = self._carpeta_destino_de
+            plan = [(entrada, destino_de(entrada, destino)) for entrada in archivos]
+
+            for carpeta_final in sorted({cf for _, cf in plan if cf is not None}):
+                self._asegurar_carpeta(carpeta_final)
+
+            # Agrupar por (carpeta final, nombre canónico): varios
+            # orígenes con el mismo nombre compiten por la misma ruta de
+            # destino, y la secuencia exists → nombre único → replace no
+            # es atómica. El nombre canónico descarta los sufijos " (n)"
+            # porque generar_nombre_unico puede producir exactamente el
+            # nombre de otro origen ("f.txt" renombrado a "f (1).txt"
+            # contra un "f (1).txt" literal); toda la cadena de posibles
+            # colisiones cae en el mismo grupo y se procesa en serie,
+            # mientras los grupos distintos siguen en paralelo
+            grupos = {}
+            for indice, (entrada, carpeta_final) in enumerate(plan):
+                if carpeta_final is None:
+                    clave = indice  # se va a ignorar: grupo propio
+                else:
+                    raiz, extension = os.path.splitext(entrada.name)
+                    nombre_canonico = _SUFIJO_COPIA.sub('', raiz) + extension
+                    clave = (os.fspath(carpeta_final), nombre_canonico)
+                grupos.setdefault(clave, []).append((entrada, carpeta_final))
+
+            # Procesar archivos en paralelo: mover/copiar son llamadas de
+            # E/S que liberan el GIL, así que los hilos solapan la latencia
+            # de cada syscall
+            max_workers = min(32, (os.cpu_count() or 4) * 4)
+            procesados = 0
+            ultimo_aviso = 0.0
+            with ThreadPoolExecutor(max_workers=max_workers) as ejecutor:
+                futuros = {
+                    ejecutor.submit(self._procesar_grupo, grupo, destino): grupo
+                    for grupo in grupos.values()
+                }
+                cancelacion_pedida = False
+                for futuro in as_completed(futuros):
+                    if self._cancelado.is_set() and not cancelacion_pedida:
+                        # Una sola pasada de cancelación; los grupos ya en
+                        # vuelo terminan y los pendientes no llegan a entrar
+                        cancelacion_pedida = True
+                        for pendiente in futuros:
+                            pendiente.cancel()
+
+                    if futuro.cancelled():
+                        continue
+                    procesados += len(futuro.result())
+
+                    # Avisar del progreso como mucho ~30 veces por segundo;
+                    # más rápido de lo que la interfaz puede pintar solo
+                    # añade sobrecarga
+                    if callback_progreso:
+                        ahora = time.monotonic()
+                        if (ahora - ultimo_aviso >= 0.033
+                                or procesados == total_archivos):
+                            ultimo_aviso = ahora
+                            progreso = procesados / total_archivos * 100
+                            ultimo = futuros[futuro][-1][0]
+                            callback_progreso(progreso, f"Procesando: {ultimo.name}")
             
             # Actualizar configuración
             self.config["estadisticas"]["total_archivos"] += self.estadisticas["archivos_procesados"]
@@ -389,19 +834,26 @@ class OrganizadorAutomatico:
             self.config["estadisticas"]["carpetas_creadas"] += self.estadisticas["carpetas_creadas"]
             self.config["estadisticas"]["ultima_organizacion"] = datetime.now().isoformat()
             
-            # Agregar al historial
-            self.config["historial"].append({
+            # Agregar al historial: append-only en disco; en config.json
+            # solo se conserva una cola acotada para mostrar
+            entrada_historial = {
                 "fecha": datetime.now().isoformat(),
                 "carpeta": carpeta_path,
                 "estadisticas": self.estadisticas.copy(),
                 "archivos_conflictivos": self.archivos_conflictivos.copy()
-            })
+            }
+            Configuracion.agregar_historial(entrada_historial)
+            self.config["historial"].append(entrada_historial)
+            del self.config["historial"][:-Configuracion.HISTORIAL_MAX]
             
             # Guardar configuración
             Configuracion.guardar(self.config)
             
+            # Una cancelación no es un error: lo ya movido cuenta y se
+            # conserva en estadísticas e historial
             return {
-                "exito": True,
+                "exito": not self._cancelado.is_set(),
+                "cancelado": self._cancelado.is_set(),
                 "estadisticas": self.estadisticas,
                 "archivos_conflictivos": self.archivos_conflictivos,
                 "carpeta_organizada": carpeta_path
@@ -410,26 +862,100 @@ class OrganizadorAutomatico:
         except Exception as e:
             return {"error": str(e), "traceback": traceback.format_exc()}
         finally:
-            self.en_ejecucion = False
-    
+            self._ejecutando.clear()
+
+    def _procesar_grupo(self, grupo, carpeta_destino):
+        """Procesa en serie los orígenes que compiten por el mismo nombre
+        de destino; la paralelización ocurre entre grupos"""
+        return [
+            self.procesar_archivo(entrada, carpeta_destino, carpeta_final)
+            for entrada, carpeta_final in grupo
+        ]
+
     def cancelar_organizacion(self):
         """Cancela la operación en curso"""
-        self.en_ejecucion = False
+        self._cancelado.set()
 
 # ============================================================================
 # INTERFAZ GRÁFICA MEJORADA
 # ============================================================================
 
+# Fuentes reutilizadas: pasar siempre la misma tupla deja que Tk acierte
+# en su caché de fuentes en lugar de re-parsear el descriptor por widget
+FUENTE_ICONO_APP = ("Segoe UI", 24)
+FUENTE_TITULO = ("Segoe UI", 20, "bold")
+FUENTE_SUBTITULO = ("Segoe UI", 14)
+FUENTE_BADGE = ("Segoe UI", 12, "bold")
+FUENTE_TEXTO = ("Segoe UI", 11)
+FUENTE_NORMAL = ("Segoe UI", 10)
+FUENTE_PEQUEÑA = ("Segoe UI", 9)
+
+# Textos largos construidos una sola vez al importar; los métodos solo
+# los muestran (o rellenan huecos con .format) en lugar de reconstruir
+# el literal multilínea en cada invocación
+TEXTO_AYUDA = """🤖 ORGANIZADOR AUTOMÁTICO - AYUDA
+
+📋 CÓMO USAR:
+1. Selecciona una carpeta usando el botón "Explorar"
+2. Configura las opciones de organización
+3. Haz clic en "ORGANIZAR AHORA"
+
+⚙️ OPCIONES:
+• Por tipo: Organiza en carpetas según la extensión
+• Por fecha: Crea subcarpetas por mes/año
+• Por proyecto: Detecta proyectos automáticamente
+• Modo seguro: No sobrescribe archivos existentes
+
+📁 CARPETAS CREADAS:
+El sistema crea una estructura como:
+📦 Carpeta_Organizados/
+ ┣ 📸 Imágenes/2024-01/
+ ┣ 📄 Documentos/2024-01/
+ ┗ 🎵 Audio/2024-01/
+
+⚠️ NOTA: Siempre haz una copia de seguridad antes de organizar archivos importantes.
+
+Para más ayuda, visita la documentación completa."""
+
+PLANTILLA_RESULTADO = """✅ Organización completada con éxito!
+
+📊 Resultados:
+• Archivos procesados: {archivos_procesados}
+• Archivos organizados: {archivos_movidos}
+• Carpetas creadas: {carpetas_creadas}
+• Espacio organizado: {espacio_mb:.2f} MB
+• Archivos omitidos: {archivos_omitidos}
+• Errores: {errores}
+
+La organización se ha completado correctamente."""
+
+
 class InterfazOrganizador:
     """Interfaz gráfica moderna y profesional"""
     
     def __init__(self):
         self.organizador = OrganizadorAutomatico()
+        # Estado de progreso compartido con el hilo trabajador: tkinter
+        # no es thread-safe, así que el trabajador solo escribe aquí y
+        # avisa con un evento virtual; los widgets se tocan en el hilo
+        # de Tk
+        self._lock_progreso = threading.Lock()
+        self._ultimo_progreso = None
+        self._progreso_pendiente = False
         self.crear_interfaz()
+        self.root.bind("<<ProgresoOrganizacion>>", self._al_progresar)
+        self.root.bind(
+            "<<OrganizacionTerminada>>",
+            lambda evento: self.finalizar_organizacion(),
+        )
     
     def crear_interfaz(self):
         """Crea la interfaz gráfica principal"""
         self.root = tk.Tk()
+        # Ventana oculta mientras se construye: Tk no intercala pasadas
+        # de geometría ni repintados por cada widget añadido; run() la
+        # muestra ya centrada y completa
+        self.root.withdraw()
         self.root.title("Organizador Automático de Carpetas - Versión Pro")
         self.root.geometry("900x700")
         self.root.configure(bg='#f5f5f5')
@@ -441,21 +967,23 @@ class InterfazOrganizador:
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(2, weight=1)
         
+        # Cargar tema antes de crear widgets: así cada ttk.Button/Entry
+        # nace ya con su estilo final y no hay un repintado extra al
+        # re-estilizarlos después
+        self.aplicar_tema()
+
         # Crear widgets
         self.crear_cabecera()
         self.crear_panel_principal()
         self.crear_barra_estado()
-        
-        # Cargar tema
-        self.aplicar_tema()
     
     def establecer_icono(self):
         """Establece el icono de la aplicación"""
         try:
             # Intentar cargar un icono personalizado
-            if platform.system() == "Windows":
+            if _OS_NOMBRE == "Windows":
                 self.root.iconbitmap(default="icono.ico")
-            elif platform.system() == "Darwin":
+            elif _OS_NOMBRE == "Darwin":
                 # macOS
                 pass
         except:
@@ -466,6 +994,8 @@ class InterfazOrganizador:
         cabecera = tk.Frame(self.root, bg='#2c3e50', height=80)
         cabecera.grid(row=0, column=0, sticky='ew', padx=0, pady=0)
         cabecera.grid_columnconfigure(0, weight=1)
+        # Altura fija: empaquetar los hijos no dispara recálculos del marco
+        cabecera.pack_propagate(False)
         
         # Logo y título
         frame_titulo = tk.Frame(cabecera, bg='#2c3e50')
@@ -474,7 +1004,7 @@ class InterfazOrganizador:
         tk.Label(
             frame_titulo,
             text="📁",
-            font=("Segoe UI", 24),
+            font=FUENTE_ICONO_APP,
             bg='#2c3e50',
             fg='white'
         ).pack(side=tk.LEFT)
@@ -482,7 +1012,7 @@ class InterfazOrganizador:
         tk.Label(
             frame_titulo,
             text="Organizador Automático",
-            font=("Segoe UI", 20, "bold"),
+            font=FUENTE_TITULO,
             bg='#2c3e50',
             fg='white'
         ).pack(side=tk.LEFT, padx=(10, 0))
@@ -490,7 +1020,7 @@ class InterfazOrganizador:
         tk.Label(
             frame_titulo,
             text="PRO",
-            font=("Segoe UI", 12, "bold"),
+            font=FUENTE_BADGE,
             bg='#e74c3c',
             fg='white',
             padx=8,
@@ -514,7 +1044,7 @@ class InterfazOrganizador:
             btn = tk.Button(
                 frame_botones,
                 text=texto,
-                font=("Segoe UI", 14),
+                font=FUENTE_SUBTITULO,
                 bg='#34495e',
                 fg='white',
                 relief=tk.FLAT,
@@ -526,27 +1056,38 @@ class InterfazOrganizador:
     
     def crear_panel_principal(self):
         """Crea el panel principal de la aplicación"""
-        # Frame principal con pestañas
+        # Frame principal con pestañas. El contenido se construye bajo
+        # demanda: al arrancar solo se paga la pestaña visible
         self.notebook = ttk.Notebook(self.root)
         self.notebook.grid(row=1, column=0, sticky='nsew', padx=20, pady=(10, 5))
-        
-        # Pestaña 1: Organización Rápida
-        self.crear_tab_organizacion()
-        
-        # Pestaña 2: Configuración Avanzada
-        self.crear_tab_configuracion()
-        
-        # Pestaña 3: Historial
-        self.crear_tab_historial()
-        
-        # Pestaña 4: Favoritos
-        self.crear_tab_favoritos()
-    
-    def crear_tab_organizacion(self):
+
+        pestañas = [
+            ("🚀 Organización Rápida", self.crear_tab_organizacion),
+            ("⚙️ Configuración", self.crear_tab_configuracion),
+            ("📊 Historial", self.crear_tab_historial),
+            ("⭐ Favoritos", self.crear_tab_favoritos),
+        ]
+
+        self._constructores_tabs = {}
+        for texto, constructor in pestañas:
+            marco = ttk.Frame(self.notebook)
+            self.notebook.add(marco, text=texto)
+            self._constructores_tabs[str(marco)] = (marco, constructor)
+
+        self.notebook.bind("<<NotebookTabChanged>>", self._al_cambiar_tab)
+        # La pestaña inicial sí se construye inmediatamente
+        self._al_cambiar_tab()
+
+    def _al_cambiar_tab(self, event=None):
+        """Construye el contenido real de una pestaña en su primera visita"""
+        seleccionada = self.notebook.select()
+        pendiente = self._constructores_tabs.pop(seleccionada, None)
+        if pendiente:
+            marco, constructor = pendiente
+            constructor(marco)
+
+    def crear_tab_organizacion(self, tab):
         """Crea la pestaña de organización rápida"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="🚀 Organización Rápida")
-        
         # Configurar grid
         for i in range(3):
             tab.grid_rowconfigure(i, weight=1)
@@ -557,12 +1098,11 @@ class InterfazOrganizador:
         frame_seleccion.grid(row=0, column=0, sticky='ew', padx=10, pady=10)
         frame_seleccion.grid_columnconfigure(0, weight=1)
         
-        # Campo de ruta
-        self.ruta_var = tk.StringVar()
+        # Campo de ruta; sin StringVar intermedio: la ruta solo se lee al
+        # pulsar organizar, y así teclear no pasa por el puente Tcl/Python
         self.entry_ruta = ttk.Entry(
             frame_seleccion,
-            textvariable=self.ruta_var,
-            font=('Segoe UI', 11)
+            font=FUENTE_TEXTO
         )
         self.entry_ruta.grid(row=0, column=0, sticky='ew', padx=(0, 10))
         
@@ -652,33 +1192,24 @@ class InterfazOrganizador:
         self.etiqueta_estado = ttk.Label(
             frame_acciones,
             text="Listo para organizar archivos",
-            font=('Segoe UI', 10)
+            font=FUENTE_NORMAL
         )
         self.etiqueta_estado.grid(row=2, column=0)
     
-    def crear_tab_configuracion(self):
+    def crear_tab_configuracion(self, tab):
         """Crea la pestaña de configuración avanzada"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="⚙️ Configuración")
-        
         # Aquí iría la configuración avanzada
-        ttk.Label(tab, text="Configuración avanzada", font=('Segoe UI', 14)).pack(pady=20)
+        ttk.Label(tab, text="Configuración avanzada", font=FUENTE_SUBTITULO).pack(pady=20)
     
-    def crear_tab_historial(self):
+    def crear_tab_historial(self, tab):
         """Crea la pestaña de historial"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="📊 Historial")
-        
         # Aquí iría el historial
-        ttk.Label(tab, text="Historial de operaciones", font=('Segoe UI', 14)).pack(pady=20)
+        ttk.Label(tab, text="Historial de operaciones", font=FUENTE_SUBTITULO).pack(pady=20)
     
-    def crear_tab_favoritos(self):
+    def crear_tab_favoritos(self, tab):
         """Crea la pestaña de carpetas favoritas"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="⭐ Favoritos")
-        
         # Aquí irían las carpetas favoritas
-        ttk.Label(tab, text="Carpetas favoritas", font=('Segoe UI', 14)).pack(pady=20)
+        ttk.Label(tab, text="Carpetas favoritas", font=FUENTE_SUBTITULO).pack(pady=20)
     
     def crear_barra_estado(self):
         """Crea la barra de estado"""
@@ -690,33 +1221,43 @@ class InterfazOrganizador:
             anchor=tk.W,
             bg='white',
             fg='#2c3e50',
-            font=('Segoe UI', 9)
+            font=FUENTE_PEQUEÑA
         )
         self.barra_estado.grid(row=3, column=0, sticky='ew', padx=0, pady=(0, 0))
     
-    def crear_tooltip(self, widget, texto):
-        """Crea un tooltip para un widget"""
-        def mostrar_tooltip(event):
-            tooltip = tk.Toplevel(widget)
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            
-            label = tk.Label(
-                tooltip,
-                text=texto,
+    def _tooltip_compartido(self):
+        """Crea (una sola vez) la ventana compartida de tooltips"""
+        if not hasattr(self, '_tooltip_win'):
+            self._tooltip_win = tk.Toplevel(self.root)
+            self._tooltip_win.wm_overrideredirect(True)
+            self._tooltip_win.withdraw()
+            self._tooltip_lbl = tk.Label(
+                self._tooltip_win,
                 bg='yellow',
                 relief='solid',
                 borderwidth=1,
-                font=('Segoe UI', 9)
+                font=FUENTE_PEQUEÑA
             )
-            label.pack()
-            
-            widget.tooltip = tooltip
-        
+            self._tooltip_lbl.pack()
+        return self._tooltip_win
+
+    def crear_tooltip(self, widget, texto):
+        """Asocia un tooltip a un widget
+
+        Todos los tooltips reutilizan una única ventana oculta: mostrar
+        uno es cambiar el texto y re-posicionarla, sin crear/destruir
+        un Toplevel en cada paso del ratón.
+        """
+        def mostrar_tooltip(event):
+            ventana = self._tooltip_compartido()
+            self._tooltip_lbl.config(text=texto)
+            ventana.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+            ventana.deiconify()
+
         def ocultar_tooltip(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-        
+            if hasattr(self, '_tooltip_win'):
+                self._tooltip_win.withdraw()
+
         widget.bind('<Enter>', mostrar_tooltip)
         widget.bind('<Leave>', ocultar_tooltip)
     
@@ -729,7 +1270,7 @@ class InterfazOrganizador:
             style.theme_use('clam')
             
             # Configurar colores
-            style.configure('TButton', font=('Segoe UI', 10))
+            style.configure('TButton', font=FUENTE_NORMAL)
             style.configure('Accent.TButton', background='#3498db', foreground='white')
             style.configure('Success.TButton', background='#27ae60', foreground='white')
             style.configure('Warning.TButton', background='#f39c12', foreground='white')
@@ -748,20 +1289,25 @@ class InterfazOrganizador:
             mustexist=True
         )
         if carpeta:
-            self.ruta_var.set(carpeta)
+            self._establecer_ruta(carpeta)
             self.etiqueta_estado.config(text=f"Carpeta seleccionada: {carpeta}")
     
+    def _establecer_ruta(self, carpeta):
+        """Reemplaza el contenido del campo de ruta"""
+        self.entry_ruta.delete(0, 'end')
+        self.entry_ruta.insert(0, carpeta)
+
     def usar_carpeta_actual(self):
         """Usa la carpeta actual del script"""
         carpeta_actual = os.getcwd()
-        self.ruta_var.set(carpeta_actual)
+        self._establecer_ruta(carpeta_actual)
         self.etiqueta_estado.config(text=f"Carpeta actual: {carpeta_actual}")
     
     def iniciar_organizacion(self):
         """Inicia el proceso de organización"""
-        carpeta = self.ruta_var.get()
+        carpeta = self.entry_ruta.get()
         
-        if not carpeta or not os.path.exists(carpeta):
+        if not carpeta or not os.path.isdir(carpeta):
             messagebox.showerror("Error", "Por favor, selecciona una carpeta válida")
             return
         
@@ -784,10 +1330,7 @@ class InterfazOrganizador:
             daemon=True
         )
         thread.start()
-        
-        # Monitorear progreso
-        self.monitorear_progreso(thread)
-    
+
     def ejecutar_organizacion(self, carpeta):
         """Ejecuta la organización en un hilo separado"""
         resultado = self.organizador.organizar_carpeta(
@@ -795,17 +1338,37 @@ class InterfazOrganizador:
             callback_progreso=self.actualizar_progreso
         )
         self.resultado_organizacion = resultado
+        # Avisar al hilo de Tk de que hemos terminado: sin sondeos de
+        # thread.is_alive() ni despertares periódicos durante la espera
+        try:
+            self.root.event_generate("<<OrganizacionTerminada>>", when='tail')
+        except tk.TclError:
+            pass  # ventana cerrada mientras trabajábamos
     
     def actualizar_progreso(self, porcentaje, mensaje):
-        """Actualiza la interfaz con el progreso"""
-        self.root.after(0, lambda: self.etiqueta_estado.config(text=mensaje))
-    
-    def monitorear_progreso(self, thread):
-        """Monitorea el progreso del hilo"""
-        if thread.is_alive():
-            self.root.after(100, lambda: self.monitorear_progreso(thread))
-        else:
-            self.finalizar_organizacion()
+        """Publica el progreso desde el hilo trabajador
+
+        Guarda solo el último estado y genera como mucho un evento
+        virtual pendiente: si Tk aún no consumió el anterior, el nuevo
+        estado lo recogerá ese mismo evento (coalescencia sin timers)
+        """
+        with self._lock_progreso:
+            self._ultimo_progreso = (porcentaje, mensaje)
+            if self._progreso_pendiente:
+                return
+            self._progreso_pendiente = True
+        try:
+            self.root.event_generate("<<ProgresoOrganizacion>>", when='tail')
+        except tk.TclError:
+            pass
+
+    def _al_progresar(self, evento=None):
+        """Aplica el último progreso publicado (en el hilo de Tk)"""
+        with self._lock_progreso:
+            progreso = self._ultimo_progreso
+            self._progreso_pendiente = False
+        if progreso is not None:
+            self.etiqueta_estado.config(text=progreso[1])
     
     def finalizar_organizacion(self):
         """Finaliza el proceso de organización"""
@@ -817,24 +1380,29 @@ class InterfazOrganizador:
         if "error" in resultado:
             messagebox.showerror("Error", resultado["error"])
             self.etiqueta_estado.config(text="Error durante la organización")
+        elif resultado.get("cancelado"):
+            estadisticas = resultado.get("estadisticas", {})
+            messagebox.showinfo(
+                "Organización Cancelada",
+                "La organización fue cancelada.\n"
+                f"Archivos ya organizados: {estadisticas.get('archivos_movidos', 0)}"
+            )
+            self.actualizar_barra_estado(estadisticas)
+            self.etiqueta_estado.config(text="Organización cancelada")
         else:
             # Mostrar resultados
             estadisticas = resultado.get("estadisticas", {})
-            archivos_movidos = estadisticas.get("archivos_movidos", 0)
             espacio_mb = estadisticas.get("espacio_liberado", 0) / (1024 * 1024)
-            
-            mensaje = f"""✅ Organización completada con éxito!
 
-📊 Resultados:
-• Archivos procesados: {estadisticas.get('archivos_procesados', 0)}
-• Archivos organizados: {archivos_movidos}
-• Carpetas creadas: {estadisticas.get('carpetas_creadas', 0)}
-• Espacio organizado: {espacio_mb:.2f} MB
-• Archivos omitidos: {estadisticas.get('archivos_omitidos', 0)}
-• Errores: {estadisticas.get('errores', 0)}
+            mensaje = PLANTILLA_RESULTADO.format(
+                archivos_procesados=estadisticas.get("archivos_procesados", 0),
+                archivos_movidos=estadisticas.get("archivos_movidos", 0),
+                carpetas_creadas=estadisticas.get("carpetas_creadas", 0),
+                espacio_mb=espacio_mb,
+                archivos_omitidos=estadisticas.get("archivos_omitidos", 0),
+                errores=estadisticas.get("errores", 0),
+            )
 
-La organización se ha completado correctamente."""
-            
             messagebox.showinfo("Organización Completada", mensaje)
             
             # Actualizar barra de estado
@@ -867,7 +1435,7 @@ La organización se ha completado correctamente."""
 • Última organización: {estadisticas['ultima_organizacion'] or 'Nunca'}
 
 💾 Configuración:
-• Sistema operativo: {platform.system()} {platform.release()}
+• Sistema operativo: {_OS_NOMBRE} {_OS_VERSION}
 • Versión del organizador: {self.organizador.config['version']}
 • Carpeta de configuración: {Configuracion.obtener_ruta_config()}"""
         
@@ -875,31 +1443,7 @@ La organización se ha completado correctamente."""
     
     def mostrar_ayuda(self):
         """Muestra la ventana de ayuda"""
-        mensaje = """🤖 ORGANIZADOR AUTOMÁTICO - AYUDA
-
-📋 CÓMO USAR:
-1. Selecciona una carpeta usando el botón "Explorar"
-2. Configura las opciones de organización
-3. Haz clic en "ORGANIZAR AHORA"
-
-⚙️ OPCIONES:
-• Por tipo: Organiza en carpetas según la extensión
-• Por fecha: Crea subcarpetas por mes/año
-• Por proyecto: Detecta proyectos automáticamente
-• Modo seguro: No sobrescribe archivos existentes
-
-📁 CARPETAS CREADAS:
-El sistema crea una estructura como:
-📦 Carpeta_Organizados/
- ┣ 📸 Imágenes/2024-01/
- ┣ 📄 Documentos/2024-01/
- ┗ 🎵 Audio/2024-01/
-
-⚠️ NOTA: Siempre haz una copia de seguridad antes de organizar archivos importantes.
-
-Para más ayuda, visita la documentación completa."""
-        
-        messagebox.showinfo("Ayuda", mensaje)
+        messagebox.showinfo("Ayuda", TEXTO_AYUDA)
     
     def actualizar_interfaz(self):
         """Actualiza la interfaz"""
@@ -915,7 +1459,8 @@ Para más ayuda, visita la documentación completa."""
         x = (self.root.winfo_screenwidth() // 2) - (ancho // 2)
         y = (self.root.winfo_screenheight() // 2) - (alto // 2)
         self.root.geometry(f'{ancho}x{alto}+{x}+{y}')
-        
+        self.root.deiconify()
+
         self.root.mainloop()
 
 # ============================================================================